@@ -5,6 +5,61 @@ from a3_support import *
 from model import *
 from constants import *
 
+# Number of growth stages for each plant, used to preload the plant images.
+# Any plant image not covered here is loaded the first time it is drawn.
+PLANT_STAGES = {
+    "potato": 5,
+    "kale": 5,
+    "berry": 6,
+}
+
+# Plant class to create for each seed, keyed by the seed's plant name
+PLANT_CLASSES = {
+    "Potato": PotatoPlant,
+    "Kale": KalePlant,
+    "Berry": BerryPlant,
+}
+
+# Image paths for each ground tile and player direction, built once at load
+TILE_PATHS = {
+    tile: f"images/{IMAGES[tile]}" for tile in (GRASS, UNTILLED, SOIL)
+}
+DIRECTION_PATHS = {
+    direction: f"images/{IMAGES[direction]}"
+    for direction in (UP, DOWN, LEFT, RIGHT)
+}
+
+
+def _cached_image(
+    master: tk.Misc, path: str, width: int, height: int
+) -> ImageTk.PhotoImage:
+    """
+    Returns the image at path resized to (width, height), loading it only
+    the first time each path and size is requested for master's window.
+
+    The pool is kept on the top-level window rather than for the whole
+    process, as a PhotoImage belongs to the Tk interpreter it was created in
+    and can not be shown once that window is destroyed. It is unbounded, as
+    evicting a PhotoImage still shown on a canvas would blank it, and the set
+    of images is small.
+
+    Args:
+        master (tk.Misc): Any widget in the window the image is shown in.
+        path (str): The path to the image to load.
+        width (int): The width to resize the image to.
+        height (int): The height to resize the image to.
+    """
+    root = master.winfo_toplevel()
+    pool = getattr(root, "_image_pool", None)
+    if pool is None:
+        pool = root._image_pool = {}
+    key = (path, width, height)
+    image = pool.get(key)
+    if image is None:
+        image = pool[key] = get_image(path, (width, height))
+    return image
+
+
 class InfoBar(AbstractGrid):
     """The InfoBar canvas which sits at the bottom of the game window.
 
@@ -69,26 +124,81 @@ class FarmView(AbstractGrid):
     ) -> None:
         """
         Sets up the FarmView to be an AbstractGrid with the appropriate
-        dimensions and size, and creates an instance attribute of an empty
-        dictionary to be used as an image cache.
+        dimensions and size. All sprites are then preloaded so that redrawing
+        never has to touch the filesystem.
 
         Args:
             master (tk.Tk | tk.Frame): The parent frame where it will be placed.
             dimensions (tuple[int, int]): The number of rows and columns.
             size (tuple[int, int]): The width and height of the FarmView.
+            **kwargs: Any extra options for the underlying canvas.
         """
         self.root = master
         self._dimensions = dimensions
         self._size = size
         self._cell_size = self.get_cell_size()
 
-        super().__init__(self.root, self._dimensions, self._size)
+        super().__init__(self.root, self._dimensions, self._size, **kwargs)
 
-        # Initialise the image cache
-        if kwargs:
-            self._cache = kwargs
-        else:
-            self._cache = {}
+        # Pixel midpoint of every cell, as the grid never changes size
+        rows, cols = self._dimensions
+        self._midpoints = {
+            (y, x): self.get_midpoint((y, x))
+            for y in range(rows)
+            for x in range(cols)
+        }
+
+        # Preload every sprite, keyed by tile, direction or plant image name
+        self._sprite_by_tile = {}
+        self.preload(self._cell_size)
+
+        # Canvas item ids and the state they were drawn from, so that
+        # redraw only needs to replace what has changed
+        self._ground_ids = {}
+        self._plant_ids = {}
+        self._player_id = None
+        self._player = None
+        self._last_ground = []
+        self._plant_images = {}
+
+    def preload(self, cell_size: tuple[int, int]) -> None:
+        """
+        Loads every ground, player and plant image once at the given cell
+        size and stores them for lookup during redraw.
+
+        Ground tiles and player directions are keyed by their character in
+        TILE_PATHS and DIRECTION_PATHS, plants are keyed by the name returned
+        from get_plant_image_name.
+
+        Args:
+            cell_size (tuple[int, int]): The width and height of each cell.
+        """
+        for paths in (TILE_PATHS, DIRECTION_PATHS):
+            for key, path in paths.items():
+                self._sprite_by_tile[key] = _cached_image(
+                    self, path, *cell_size
+                )
+        for plant_name, stages in PLANT_STAGES.items():
+            for stage in range(1, stages + 1):
+                image_name = f"plants/{plant_name}/stage_{stage}.png"
+                self._sprite_by_tile[image_name] = _cached_image(
+                    self, f"images/{image_name}", *cell_size
+                )
+        return None
+
+    def clear(self) -> None:
+        """
+        Clears all images off the farm view, and forgets the canvas items and
+        state they were drawn from, so that the next redraw draws everything.
+        """
+        super().clear()
+        self._ground_ids = {}
+        self._plant_ids = {}
+        self._player_id = None
+        self._player = None
+        self._last_ground = []
+        self._plant_images = {}
+        return None
 
     def redraw(
         self,
@@ -98,11 +208,13 @@ class FarmView(AbstractGrid):
         player_direction: str,
     ) -> None:
         """
-        Clears the farm view, then creates (on the FarmView instance) the
-        images for the ground, then the plants, then the player. That is, the
-        player and plants should render in front of the ground, and the player
-        should render in front of the plants. You must use the get image
-        function from a3 support.py to create your images.
+        Draws the images for the ground, then the plants, then the player.
+        That is, the player and plants should render in front of the ground,
+        and the player should render in front of the plants.
+
+        The first call draws the whole farm. Later calls compare the given
+        state against what is currently drawn and only replace the images for
+        the tiles, plants and player that have changed.
 
         Args:
             ground (list[str]): A list of strings representing the ground.
@@ -113,61 +225,188 @@ class FarmView(AbstractGrid):
             player_direction (str): A string representing the player's
                 direction as one of UP, DOWN, LEFT, or RIGHT.
         """
+        plant_images = {
+            position: get_plant_image_name(plant)
+            for position, plant in plants.items()
+        }
+        player = (player_position, player_direction)
+
+        if self._player_id is None:
+            self.redraw_full(ground, plant_images, player)
+            return None
+
+        # Only rows that differ need to be compared tile by tile
+        changed_tiles = [
+            (y, x)
+            for y, (row, old_row) in enumerate(zip(ground, self._last_ground))
+            if row != old_row
+            for x, (tile, old_tile) in enumerate(zip(row, old_row))
+            if tile != old_tile
+        ]
+        changed_plants = [
+            position
+            for position in plant_images.keys() | self._plant_images.keys()
+            if plant_images.get(position) != self._plant_images.get(position)
+        ]
+        self.redraw_incremental(
+            ground, plant_images, player, changed_tiles, changed_plants
+        )
+        return None
+
+    def redraw_full(
+        self,
+        ground: list[str],
+        plant_images: dict[tuple[int, int], str],
+        player: tuple[tuple[int, int], str],
+    ) -> None:
+        """
+        Clears the farm view and draws every ground tile, plant and the player.
 
+        Args:
+            ground (list[str]): A list of strings representing the ground.
+            plant_images (dict[tuple[int, int], str]): A dictionary which maps
+                plant positions to the image name of each plant.
+            player (tuple[tuple[int, int], str]): The player's position and
+                direction.
+        """
         # Clear the current images
         self.clear()
 
         # Draw the ground
         for y, row in enumerate(ground):
             for x, tile in enumerate(row):
-                if tile == "G":
-                    self.create_image(
-                        self.get_midpoint((y, x)),
-                        image=get_image(
-                            f"images/{IMAGES[GRASS]}",
-                            self._cell_size,
-                            self._cache,
-                        ),
-                    )
-                if tile == "U":
-                    self.create_image(
-                        self.get_midpoint((y, x)),
-                        image=get_image(
-                            f"images/{IMAGES[UNTILLED]}",
-                            self._cell_size,
-                            self._cache,
-                        ),
-                    )
-                if tile == "S":
-                    self.create_image(
-                        self.get_midpoint((y, x)),
-                        image=get_image(
-                            f"images/{IMAGES[SOIL]}",
-                            self._cell_size,
-                            self._cache,
-                        ),
-                    )
+                self._draw_tile((y, x), tile)
 
         # Draw the plants
-        for position, plant in plants.items():
-            self.create_image(
-                self.get_midpoint(position),
-                image=get_image(
-                    f"images/{get_plant_image_name(plant)}",
-                    self._cell_size,
-                    self._cache,
-                ),
-            )
+        for position, image_name in plant_images.items():
+            self._draw_plant(position, image_name)
 
         # Draw the player
-        self.create_image(
-            self.get_midpoint(player_position),
-            image=get_image(
-                f"images/{IMAGES[player_direction]}",
-                self._cell_size,
-                self._cache,
-            ),
+        self._draw_player(player)
+
+        self._last_ground = list(ground)
+        self._plant_images = plant_images
+        return None
+
+    def redraw_incremental(
+        self,
+        ground: list[str],
+        plant_images: dict[tuple[int, int], str],
+        player: tuple[tuple[int, int], str],
+        changed_tiles: list[tuple[int, int]],
+        changed_plants: list[tuple[int, int]],
+    ) -> None:
+        """
+        Updates only the images for the given changed tiles and plants, and
+        the player if it has moved or turned.
+
+        Args:
+            ground (list[str]): A list of strings representing the ground.
+            plant_images (dict[tuple[int, int], str]): A dictionary which maps
+                plant positions to the image name of each plant.
+            player (tuple[tuple[int, int], str]): The player's position and
+                direction.
+            changed_tiles (list[tuple[int, int]]): Positions of the ground
+                tiles that differ from those currently drawn.
+            changed_plants (list[tuple[int, int]]): Positions where a plant
+                was added, removed or changed stage.
+        """
+        # Existing canvas items are reconfigured in place, which also keeps
+        # their stacking order, rather than deleted and created again
+        for y, x in changed_tiles:
+            tile_id = self._ground_ids.get((y, x))
+            sprite = self._sprite_by_tile.get(ground[y][x])
+            if tile_id is None:
+                tile_id = self._draw_tile((y, x), ground[y][x])
+                if tile_id is not None:
+                    self.tag_lower(tile_id)
+            elif sprite is None:
+                self.delete(self._ground_ids.pop((y, x)))
+            else:
+                self.itemconfig(tile_id, image=sprite)
+
+        plant_added = False
+        for position in changed_plants:
+            plant_id = self._plant_ids.get(position)
+            if position not in plant_images:
+                self.delete(self._plant_ids.pop(position))
+            elif plant_id is None:
+                self._draw_plant(position, plant_images[position])
+                plant_added = True
+            else:
+                self.itemconfig(
+                    plant_id,
+                    image=self._plant_sprite(plant_images[position]),
+                )
+
+        if player != self._player:
+            position, direction = player
+            self.coords(self._player_id, *self._midpoints[position])
+            self.itemconfig(
+                self._player_id, image=self._sprite_by_tile[direction]
+            )
+            self._player = player
+        if plant_added:
+            self.tag_raise(self._player_id)
+
+        self._last_ground = list(ground)
+        self._plant_images = plant_images
+        return None
+
+    def _draw_tile(
+        self, position: tuple[int, int], tile: str
+    ) -> Optional[int]:
+        """
+        Creates the image for a ground tile and records its canvas id.
+
+        Returns:
+            Optional[int]: The id of the new canvas item, or None if the tile
+                has no image.
+        """
+        sprite = self._sprite_by_tile.get(tile)
+        if sprite is None:
+            return None
+        tile_id = self.create_image(self._midpoints[position], image=sprite)
+        self._ground_ids[position] = tile_id
+        return tile_id
+
+    def _draw_plant(self, position: tuple[int, int], image_name: str) -> None:
+        """
+        Creates the image for a plant and records its canvas id.
+        """
+        self._plant_ids[position] = self.create_image(
+            self._midpoints[position],
+            image=self._plant_sprite(image_name),
+        )
+        return None
+
+    def _plant_sprite(self, image_name: str) -> ImageTk.PhotoImage:
+        """
+        Returns the sprite for a plant image, loading and storing it if it
+        was not preloaded.
+
+        Args:
+            image_name (str): The plant image name, relative to the images
+                directory.
+        """
+        sprite = self._sprite_by_tile.get(image_name)
+        if sprite is None:
+            sprite = _cached_image(
+                self, f"images/{image_name}", *self._cell_size
+            )
+            self._sprite_by_tile[image_name] = sprite
+        return sprite
+
+    def _draw_player(self, player: tuple[tuple[int, int], str]) -> None:
+        """
+        Creates the image for the player and records its canvas id.
+        """
+        position, direction = player
+        self._player_id = self.create_image(
+            self._midpoints[position],
+            image=self._sprite_by_tile[direction],
         )
+        self._player = player
         return None
 
 
@@ -220,6 +459,13 @@ class ItemView(tk.Frame):
         # Store whether or not the item can be bought
         self._can_buy = self.item_name in BUY_PRICES
 
+        # Prices never change, so their label text is only formatted once
+        self._sell_text = f"Sell price: ${SELL_PRICES[self.item_name]}"
+        if self._can_buy:
+            self._buy_text = f"Buy price: ${BUY_PRICES[self.item_name]}"
+        else:
+            self._buy_text = "Buy price: $N/A"
+
         # Init frame
         super().__init__(
             self.root,
@@ -240,16 +486,8 @@ class ItemView(tk.Frame):
         item_label = tk.Label(
             item_label_frame, text=f"{self.item_name}: {self._amount}"
         )
-        sell_label = tk.Label(
-            item_label_frame, text=f"Sell price: ${SELL_PRICES[self.item_name]}"
-        )
-        if self._can_buy:
-            buy_label = tk.Label(
-                item_label_frame,
-                text=f"Buy price: ${BUY_PRICES[self.item_name]}",
-            )
-        else:
-            buy_label = tk.Label(item_label_frame, text="Buy price: $N/A")
+        sell_label = tk.Label(item_label_frame, text=self._sell_text)
+        buy_label = tk.Label(item_label_frame, text=self._buy_text)
         self.label_list.extend([item_label, sell_label, buy_label])
 
         # Create button frame and buttons
@@ -287,6 +525,8 @@ class ItemView(tk.Frame):
             label.bind("<Button-1>", self._on_click)
         self.bind("<Button-1>", self._on_click)
 
+        # The labels have no colour yet, so the first update must set it
+        self._current_bg = None
         self.update(amount)
 
     def update(self, amount: int, selected: bool = False) -> None:
@@ -311,21 +551,16 @@ class ItemView(tk.Frame):
         if selected:
             bg_color = INVENTORY_SELECTED_COLOUR
 
-        # Update the label and frame colors
-        for frame in self.frame_list:
-            frame.config(bg=bg_color)
-        for label in self.label_list:
-            label.config(bg=bg_color)
+        # Update the label and frame colors, only if they have changed
+        if bg_color != self._current_bg:
+            for frame in self.frame_list:
+                frame.config(bg=bg_color)
+            for label in self.label_list:
+                label.config(bg=bg_color)
+            self._current_bg = bg_color
 
-        # Update the item label text
+        # Update the item label text, the price labels never change
         self.label_list[0].config(text=f"{self.item_name}: {self._amount}")
-        self.label_list[1].config(
-            text=f"Sell price: ${SELL_PRICES[self.item_name]}"
-        )
-        if self._can_buy:
-            self.label_list[2].config(
-                text=f"Buy price: ${BUY_PRICES[self.item_name]}"
-            )
         return None
 
     def _on_click(self, tk_event: tk.Event) -> None:
@@ -350,7 +585,7 @@ class FarmGame():
 
         This includes the following steps:
         - Sets the title of the window.
-        - Creates the title banner (using the get_image function).
+        - Creates the title banner (using the shared image pool).
         - Creates the FarmModel instance.
         - Creates the instances of the view classes,
          and ensure they display as per the spec.
@@ -375,7 +610,9 @@ class FarmGame():
 
         # Create the title banner object
         self.banner_size = (FARM_WIDTH + INVENTORY_WIDTH, BANNER_HEIGHT)
-        self.banner_image = get_image("images/header.png", self.banner_size)
+        self.banner_image = _cached_image(
+            self.root, "images/header.png", *self.banner_size
+        )
 
         # Create the banner label and pack it into the root frame
         self.banner = tk.Label(self.root, image=self.banner_image)
@@ -392,7 +629,7 @@ class FarmGame():
         # Create the next day button and pack it into the root frame
         self.next_day_command = lambda: (
             self.gamemodel.new_day(),
-            self.redraw(),
+            self._schedule_redraw(),
         )
         self.next_day_button = tk.Button(
             self.infobar_frame, text="Next day", command=self.next_day_command
@@ -424,45 +661,113 @@ class FarmGame():
                 lambda item=item: self.sell_item(item),
                 lambda item=item: self.buy_item(item),
             )
-            if item_amount:
-                item_view.configure(bg=INVENTORY_COLOUR)
-            else:
-                item_view.configure(bg=INVENTORY_EMPTY_COLOUR)
             item_view.pack(side="top", fill="both", expand=True)
             self.item_view_dict[item] = item_view
 
+        # Dictionary of keypress events, built once for handle_keypress
+        self._key_dispatch = {
+            "w": self.player_movement,
+            "a": self.player_movement,
+            "s": self.player_movement,
+            "d": self.player_movement,
+            "p": self.player_interaction,
+            "h": self.player_interaction,
+            "r": self.player_interaction,
+            "t": self.player_interaction,
+            "u": self.player_interaction,
+        }
+
+        # Dictionary of interaction helpers, built once for player_interaction
+        self._interactions = {
+            "t": self.till_helper,
+            "u": self.untill_helper,
+            "p": self.planting_helper,
+            "h": self.harvest_helper,
+            "r": self.remove_helper,
+        }
+
         # Bind the handle keypress method to the "<KeyPress>" event
         self.root.bind("<KeyPress>", self.handle_keypress)
 
+        # Whether a redraw has already been scheduled for when Tk is idle,
+        # and the game state that was last drawn
+        self._redraw_pending = False
+        self._last_drawn_state = None
+
         # Redraw the game
         self.redraw()
 
     def redraw(self) -> None:
         """
-        Redraws the entire game based on the current model state.
+        Redraws the entire game based on the current model state. Nothing is
+        redrawn if the state is the same as when the game was last drawn.
         """
         self.startup_helper()
+        player = self.gamemodel.get_player()
+        inventory = player.get_inventory()
+        ground = self.gamemodel.get_map()
+        plants = self.gamemodel.get_plants()
+
+        # Skip the redraw if nothing visible has changed, e.g. walking into
+        # a wall or harvesting where there is no plant
+        state = (
+            tuple(ground),
+            tuple(
+                (position, plant.get_name(), plant.get_stage())
+                for position, plant in plants.items()
+            ),
+            player.get_position(),
+            player.get_direction(),
+            self.gamemodel.get_days_elapsed(),
+            player.get_money(),
+            player.get_energy(),
+            tuple(inventory.items()),
+            self.selected_item,
+        )
+        if state == self._last_drawn_state:
+            return None
+        self._last_drawn_state = state
+
         self.farm_view.redraw(
-            self.gamemodel.get_map(),
-            self.gamemodel.get_plants(),
-            self.gamemodel.get_player_position(),
-            self.gamemodel.get_player_direction(),
+            ground,
+            plants,
+            player.get_position(),
+            player.get_direction(),
         )
         self.infobar.redraw(
             self.gamemodel.get_days_elapsed(),
-            self.gamemodel.get_player().get_money(),
-            self.gamemodel.get_player().get_energy(),
+            player.get_money(),
+            player.get_energy(),
         )
-        for item in self.item_view_dict:
-            item_amount = self.gamemodel.get_player().get_inventory().get(item)
+        for item, item_view in self.item_view_dict.items():
+            item_amount = inventory.get(item)
             if (
                 self.selected_item
                 and item == self.selected_item
                 and item_amount
             ):
-                self.item_view_dict[item].update(item_amount, True)
+                item_view.update(item_amount, True)
             else:
-                self.item_view_dict[item].update(item_amount)
+                item_view.update(item_amount)
+        return None
+
+    def _schedule_redraw(self) -> None:
+        """
+        Schedules a redraw for the next time Tk is idle. Any further requests
+        made before then, such as from held down keys, share that one redraw.
+        """
+        if self._redraw_pending:
+            return None
+        self._redraw_pending = True
+        self.root.after_idle(self._do_redraw)
+        return None
+
+    def _do_redraw(self) -> None:
+        """
+        Performs a scheduled redraw.
+        """
+        self._redraw_pending = False
+        self.redraw()
         return None
 
     def handle_keypress(self, event: tk.Event) -> None:
@@ -475,27 +780,11 @@ class FarmGame():
         Args:
             event (tk.Event): _description_
         """
-        # Dictionary of keypress events
-        key_options = {
-            "w": self.player_movement,
-            "a": self.player_movement,
-            "s": self.player_movement,
-            "d": self.player_movement,
-            "p": self.player_interaction,
-            "h": self.player_interaction,
-            "r": self.player_interaction,
-            "t": self.player_interaction,
-            "u": self.player_interaction,
-        }
-
-        # Get the event from the dictionary
-        which_event = key_options.get(event.keysym)
-
-        # Call the event if it exists
+        # Get the event handler for the key, if there is one, and call it
+        which_event = self._key_dispatch.get(event.keysym)
         if which_event:
             which_event(event)
-        else:
-            return None
+        return None
 
     def player_movement(self, event: tk.Event) -> None:
         """
@@ -506,15 +795,8 @@ class FarmGame():
         Args:
             event (tk.Event): The keypress event that triggered this method.
         """
-        if event.keysym == "w":
-            self.gamemodel.move_player("w")
-        elif event.keysym == "a":
-            self.gamemodel.move_player("a")
-        elif event.keysym == "s":
-            self.gamemodel.move_player("s")
-        elif event.keysym == "d":
-            self.gamemodel.move_player("d")
-        self.redraw()
+        self.gamemodel.move_player(event.keysym)
+        self._schedule_redraw()
         return None
 
     def player_interaction(self, event: tk.Event) -> None:
@@ -526,63 +808,79 @@ class FarmGame():
         Args:
             event (tk.Event): The keypress event that triggered this method.
         """
-        if event.keysym == "t":
-            self.gamemodel.till_soil(self.gamemodel.get_player_position())
-        elif event.keysym == "u":
-            self.gamemodel.untill_soil(self.gamemodel.get_player_position())
-        elif event.keysym == "p":
-            self.planting_helper()
-        elif event.keysym == "h":
-            self.harvest_helper()
-        elif event.keysym == "r":
-            self.remove_helper()
-        self.redraw()
+        interaction = self._interactions.get(event.keysym)
+        if interaction is None:
+            return None
+        interaction(self.gamemodel.get_player_position())
+        self._schedule_redraw()
         return None
 
-    def planting_helper(self) -> None:
+    def till_helper(self, position: tuple[int, int]) -> None:
         """
-        A helper method to handle planting seeds.
+        A helper method to handle tilling soil.
+
+        Args:
+            position (tuple[int, int]): The player's current position.
         """
-        PLANT_CLASSES = {
-            "Potato": PotatoPlant(),
-            "Kale": KalePlant(),
-            "Kal": KalePlant(),
-            "Berry": BerryPlant(),
-        }
+        self.gamemodel.till_soil(position)
+        return None
 
-        player_pos = self.gamemodel.get_player_position()
+    def untill_helper(self, position: tuple[int, int]) -> None:
+        """
+        A helper method to handle untilling soil.
+
+        Args:
+            position (tuple[int, int]): The player's current position.
+        """
+        self.gamemodel.untill_soil(position)
+        return None
+
+    def planting_helper(self, position: tuple[int, int]) -> None:
+        """
+        A helper method to handle planting seeds.
+
+        Args:
+            position (tuple[int, int]): The player's current position.
+        """
+        player = self.gamemodel.get_player()
         sel_item = self.selected_item
         if (
             sel_item
             and sel_item in SEEDS
-            and self.gamemodel.get_player().get_inventory().get(sel_item)
+            and player.get_inventory().get(sel_item)
         ):
-            plant_name = self.selected_item.strip(" Seed")
-            if self.gamemodel.add_plant(player_pos, PLANT_CLASSES[plant_name]):
-                self.gamemodel.get_player().remove_item((sel_item, 1))
+            plant_name = sel_item.removesuffix(" Seed")
+            plant = PLANT_CLASSES[plant_name]()
+            if self.gamemodel.add_plant(position, plant):
+                player.remove_item((sel_item, 1))
         return None
 
-    def harvest_helper(self) -> None:
+    def harvest_helper(self, position: tuple[int, int]) -> None:
         """
         A helper method to handle harvesting plants.
+
+        Args:
+            position (tuple[int, int]): The player's current position.
         """
-        current_position = self.gamemodel.get_player_position()
-        plant_at_pos = self.gamemodel.get_plants().get(current_position)
+        plant_at_pos = self.gamemodel.get_plants().get(position)
         if plant_at_pos:
             if plant_at_pos.can_harvest():
-                self.gamemodel.get_player().add_item((plant_at_pos.harvest()))
-                self.gamemodel.remove_plant(current_position)
-                self.gamemodel.get_player().reduce_energy(HARVEST_COST)
+                player = self.gamemodel.get_player()
+                player.add_item((plant_at_pos.harvest()))
+                self.gamemodel.remove_plant(position)
+                player.reduce_energy(HARVEST_COST)
         return None
 
-    def remove_helper(self) -> None:
+    def remove_helper(self, position: tuple[int, int]) -> None:
         """
         A helper method to handle removing plants.
+
+        Args:
+            position (tuple[int, int]): The player's current position.
         """
-        current_position = self.gamemodel.get_player_position()
-        plant_at_pos = self.gamemodel.get_plants().get(current_position)
+        plant_at_pos = self.gamemodel.get_plants().get(position)
         if plant_at_pos:
-            self.gamemodel.remove_plant(current_position)
+            self.gamemodel.remove_plant(position)
         return None
 
     def select_item(self, item_name: str) -> None:
@@ -594,12 +892,11 @@ class FarmGame():
         Args:
             item_name (str): The name of the item to be selected.
         """
+        # Reselecting the current item changes nothing, so skip the redraw
+        if self.selected_item == item_name:
+            return None
         self.selected_item = item_name
-        for item in self.item_view_dict:
-            item_amount = self.gamemodel.get_player().get_inventory().get(item)
-            if item == self.selected_item:
-                self.item_view_dict[item].update(item_amount, True)
-        self.redraw()
+        self._schedule_redraw()
         return None
 
     def buy_item(self, item_name: str) -> None:
@@ -618,7 +915,7 @@ class FarmGame():
             )
         else:
             return None
-        self.redraw()
+        self._schedule_redraw()
         return None
 
     def sell_item(self, item_name: str) -> None:
@@ -632,7 +929,7 @@ class FarmGame():
             item_name (str): The name of the item to be sold.
         """
         self.gamemodel.get_player().sell(item_name, SELL_PRICES.get(item_name))
-        self.redraw()
+        self._schedule_redraw()
         return None
 
     def startup_helper(self) -> None:
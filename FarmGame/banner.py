@@ -7,22 +7,29 @@ from a3_support import *
 from model import *
 from constants import *
 
-# Create an instance of tkinter window
-win = Tk()
 
-# Define the geometry of the window
-win.geometry(f'{FARM_WIDTH + INVENTORY_WIDTH}x{FARM_WIDTH + INFO_BAR_HEIGHT + BANNER_HEIGHT}')
+def main() -> None:
+    """Displays the banner image in its own window."""
+    # Create an instance of tkinter window
+    win = Tk()
 
-frame = Frame(win, width=FARM_WIDTH + INVENTORY_WIDTH, height=BANNER_HEIGHT)
-frame.pack()
-frame.place(anchor='n', relx=0.5, rely=0)
+    # Define the geometry of the window
+    win.geometry(f'{FARM_WIDTH + INVENTORY_WIDTH}x{FARM_WIDTH + INFO_BAR_HEIGHT + BANNER_HEIGHT}')
 
-# Create an object of tkinter ImageTk
-banner_size = (FARM_WIDTH + INVENTORY_WIDTH, BANNER_HEIGHT)
-img = get_image('images/header.png', banner_size)
+    frame = Frame(win, width=FARM_WIDTH + INVENTORY_WIDTH, height=BANNER_HEIGHT)
+    frame.pack()
+    frame.place(anchor='n', relx=0.5, rely=0)
 
-# Create a Label Widget to display the text or Image
-label = Label(frame, image = img)
-label.pack()
+    # Create an object of tkinter ImageTk
+    banner_size = (FARM_WIDTH + INVENTORY_WIDTH, BANNER_HEIGHT)
+    img = get_image('images/header.png', banner_size)
 
-win.mainloop()
\ No newline at end of file
+    # Create a Label Widget to display the text or Image
+    label = Label(frame, image = img)
+    label.pack()
+
+    win.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,23 @@
+import sys
+from collections.abc import Mapping
+from itertools import count
+from types import MappingProxyType
 from a2_support import *
 
+# Status modifier names, interned so every lookup shares one key object.
+STRENGTH = sys.intern("strength")
+WEAK = sys.intern("weak")
+VULNERABLE = sys.intern("vulnerable")
+
+# The order of the values in a card's status values tuple.
+STATUS_ORDER = (STRENGTH, WEAK, VULNERABLE)
+STRENGTH_INDEX = STATUS_ORDER.index(STRENGTH)
+WEAK_INDEX = STATUS_ORDER.index(WEAK)
+VULNERABLE_INDEX = STATUS_ORDER.index(VULNERABLE)
+
+# Shared, read-only status modifiers for every card that applies none.
+EMPTY_STATUS_MODIFIERS = MappingProxyType({})
+
 
 class Card:
     """An abstract base class representing a card in the game.
@@ -12,31 +30,142 @@ class Card:
         damage (int): The amount of damage this card does to its target
         block (int): The amount of block this card gives to its target 
         energy_cost (int): The amount of energy this card costs to play
-        status_modifiers (dict): A dictionary describing each status modifier
-        applied when this card is played.
+        status_modifiers (Mapping[str, int]): A read-only mapping describing
+        each status modifier applied when this card is played.
         description (str): A description of the card.
         requires_target (bool): True if playing this card requires a target,
         False otherwise.
     """
 
+    __slots__ = (
+        '_damage',
+        '_block',
+        '_energy_cost',
+        '_status_modifiers',
+        '_name',
+        '_description',
+        '_requires_target',
+        '_str_cached',
+        '_repr_cached',
+        '_status_values',
+    )
+
+    # Whether the class declares its values as class constants, in which case
+    # __new__ shares _INSTANCE, its one instance, between every call.
+    _SHARED = False
+    _INSTANCE = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Computes the string representations and status values of each Card
+        subclass once, as its name, description and status modifiers are
+        class constants.
+
+        Subclasses that instead set their values through Card.__init__ are
+        left alone, and keep these values on the instance.
+        """
+        super().__init_subclass__(**kwargs)
+        name, description = cls._name, cls._description
+        cls._SHARED = isinstance(name, str)
+        if isinstance(name, str) and isinstance(description, str):
+            cls._str_cached = f"{name}: {description}"
+            cls._repr_cached = f"{name}()"
+        status_modifiers = cls._status_modifiers
+        if isinstance(status_modifiers, MappingProxyType):
+            cls._status_values = tuple(
+                status_modifiers.get(status, 0) for status in STATUS_ORDER)
+
+    def __new__(cls, *args, **kwargs) -> 'Card':
+        """Returns a new Card, or the shared instance of a Card subclass.
+
+        Every instance of a Card subclass whose values are class constants is
+        identical, so such a subclass is a flyweight: the first call creates
+        the instance and every later call returns that same instance. Plain
+        Card instances, and subclasses that set their values through
+        Card.__init__, are still created individually.
+        """
+        if not cls._SHARED:
+            return super().__new__(cls)
+        instance = cls.__dict__.get('_INSTANCE')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._INSTANCE = instance
+        return instance
+
     def __init__(
         self,
         card: str = 'Card',
         damage: int = 0,
         block: int = 0,
         energy_cost: int = 1,
-        status_modifiers: dict = {},
+        status_modifiers: Mapping[str, int] | None = None,
         description: str = 'A card.',
         requires_target: bool = True,
     ) -> None:
-        """Initialize the Card instance with the given attribute values."""
-        self._damage = damage
-        self._block = block
-        self._energy_cost = energy_cost
-        self._status_modifiers = status_modifiers
-        self._name = card
-        self._description = description
-        self._requires_target = requires_target
+        """Initialize the Card instance with the given attribute values.
+
+        Subclasses whose values are class constants share one instance that
+        needs no initializing, so this returns straight away for them.
+
+        Cards are frozen, so the values are written with object.__setattr__,
+        and a card that already has its values can not be initialized again.
+        The status modifiers are stored as a read-only copy.
+        """
+        if type(self)._SHARED:
+            return
+        if hasattr(self, '_name'):
+            raise AttributeError(f"{type(self).__name__} is frozen")
+        if status_modifiers is None:
+            status_modifiers = EMPTY_STATUS_MODIFIERS
+        else:
+            status_modifiers = MappingProxyType(dict(status_modifiers))
+        setattr_ = object.__setattr__
+        setattr_(self, '_damage', damage)
+        setattr_(self, '_block', block)
+        setattr_(self, '_energy_cost', energy_cost)
+        setattr_(self, '_status_modifiers', status_modifiers)
+        setattr_(self, '_name', card)
+        setattr_(self, '_description', description)
+        setattr_(self, '_requires_target', requires_target)
+        setattr_(self, '_str_cached', f"{card}: {description}")
+        setattr_(self, '_repr_cached', f"{card}()")
+        setattr_(self, '_status_values', tuple(
+            status_modifiers.get(status, 0) for status in STATUS_ORDER))
+
+    def __setattr__(self, name: str, value) -> None:
+        """Raises AttributeError, as a card can not change once created."""
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        """Raises AttributeError, as a card can not change once created."""
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __copy__(self) -> 'Card':
+        """Returns self, as a card can not change once created."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'Card':
+        """Returns self, as a card can not change once created."""
+        return self
+
+    def __reduce__(self) -> tuple:
+        """Returns how to recreate this card when it is pickled.
+
+        A card whose values are class constants is recreated by calling its
+        class, which returns the shared instance. Any other card is rebuilt
+        from its values through Card.__init__.
+        """
+        if type(self)._SHARED:
+            return (type(self), ())
+        return (_rebuild_card, (
+            type(self),
+            self._name,
+            self._damage,
+            self._block,
+            self._energy_cost,
+            dict(self._status_modifiers),
+            self._description,
+            self._requires_target,
+        ))
 
     def get_damage_amount(self) -> int:
         """Returns the amount of damage this card does to its target (i.e. the
@@ -78,10 +207,7 @@ class Card:
             >>> card.get_strength()
             2
         """
-        self._strength = 0
-        if "strength" in self._status_modifiers:
-            self._strength = self._status_modifiers["strength"]
-        return self._strength
+        return self._status_values[STRENGTH_INDEX]
 
     def get_energy_cost(self) -> int:
         """Returns the amount of energy this card costs to play.
@@ -97,19 +223,37 @@ class Card:
         """
         return self._energy_cost
 
-    def get_status_modifiers(self) -> dict[str, int]:
-        """Returns a dictionary describing each status modifier applied.
+    def get_status_modifiers(self) -> Mapping[str, int]:
+        """Returns a read-only mapping describing each status modifier applied.
 
         Returns:
-            Dict[str, int]: The status modifiers dictionary of the card.
+            Mapping[str, int]: The status modifiers of the card.
 
         Example:
             >>> card = Card(card="card_name", status_modifiers={"weak": 2})
             >>> card.get_status_modifiers()
-            {'weak': 2}
+            mappingproxy({'weak': 2})
         """
         return self._status_modifiers
 
+    def get_status_values(self) -> tuple[int, int, int]:
+        """Returns the strength, weak and vulnerable this card applies.
+
+        The values are in STATUS_ORDER, so read them with STRENGTH_INDEX,
+        WEAK_INDEX and VULNERABLE_INDEX. Missing status modifiers are 0. This
+        is the same information as get_status_modifiers, but without any
+        dictionary lookups.
+
+        Returns:
+            tuple[int, int, int]: The card's (strength, weak, vulnerable).
+
+        Example:
+            >>> card = Card(card="card_name", status_modifiers={"weak": 2})
+            >>> card.get_status_values()
+            (0, 2, 0)
+        """
+        return self._status_values
+
     def get_name(self) -> str:
         """Returns the name of the card. 
 
@@ -171,7 +315,7 @@ class Card:
             >>> str(card)
             'Card: A card.'
         """
-        return f"{self._name}: {self._description}"
+        return self._str_cached
 
     def __repr__(self) -> str:
         """Returns the text that would be required to create
@@ -187,7 +331,17 @@ class Card:
             >>> strike
             Strike()
         """
-        return f"{self._name}()"
+        return self._repr_cached
+
+
+def _rebuild_card(cls: type, *args) -> Card:
+    """Returns a new card of type cls, initialized by Card.__init__ with args.
+
+    Used to unpickle cards whose values are not class constants.
+    """
+    card = cls.__new__(cls)
+    Card.__init__(card, *args)
+    return card
 
 
 class Strike(Card):
@@ -204,9 +358,9 @@ class Strike(Card):
             set to 0.
         energy_cost (int): The amount of energy this card costs to play,
             set to 1.
-        status_modifiers (Dict[str, int]): A dictionary describing each status
-            modifier applied when this card is played,
-            set to an empty dictionary.
+        status_modifiers (Mapping[str, int]): A read-only mapping describing
+            each status modifier applied when this card is played,
+            set to an empty mapping.
         requires_target (bool): True if playing this card requires a target,
             False otherwise, set to True.
 
@@ -227,10 +381,15 @@ class Strike(Card):
         Strike()
     """
 
-    def __init__(self) -> None:
-        super().__init__(card="Strike", damage=6, block=0,
-                         energy_cost=1, status_modifiers={},
-                         description="Deal 6 damage.", requires_target=True)
+    __slots__ = ()
+
+    _name = "Strike"
+    _description = "Deal 6 damage."
+    _damage = 6
+    _block = 0
+    _energy_cost = 1
+    _status_modifiers = EMPTY_STATUS_MODIFIERS
+    _requires_target = True
 
 
 class Defend(Card):
@@ -248,9 +407,9 @@ class Defend(Card):
             set to 5.
         energy_cost (int): The amount of energy this card costs to play,
             set to 1.
-        status_modifiers (Dict[str, int]): A dictionary describing each status
-            modifier applied when this card is played,
-            set to an empty dictionary.
+        status_modifiers (Mapping[str, int]): A read-only mapping describing
+            each status modifier applied when this card is played,
+            set to an empty mapping.
         requires_target (bool): True if playing this card requires a target,
             False otherwise, set to False.
 
@@ -271,11 +430,15 @@ class Defend(Card):
         Defend()
     """
 
-    def __init__(self) -> None:
-        super().__init__(card="Defend", damage=0, block=5, energy_cost=1,
-                         status_modifiers={},
-                         description="Gain 5 block.",
-                         requires_target=False)
+    __slots__ = ()
+
+    _name = "Defend"
+    _description = "Gain 5 block."
+    _damage = 0
+    _block = 5
+    _energy_cost = 1
+    _status_modifiers = EMPTY_STATUS_MODIFIERS
+    _requires_target = False
 
 
 class Bash(Card):
@@ -294,9 +457,9 @@ class Bash(Card):
             set to 5.
         energy_cost (int): The amount of energy this card costs to play,
             set to 2.
-        status_modifiers (Dict[str, int]): A dictionary describing each status
-            modifier applied when this card is played,
-            set to an empty dictionary.
+        status_modifiers (Mapping[str, int]): A read-only mapping describing
+            each status modifier applied when this card is played,
+            set to an empty mapping.
         requires_target (bool): True if playing this card requires a target,
             False otherwise, set to True.
 
@@ -316,11 +479,15 @@ class Bash(Card):
         >>> bash Bash()
     """
 
-    def __init__(self) -> None:
-        super().__init__(card="Bash", damage=7, block=5, energy_cost=2,
-                         status_modifiers={},
-                         description="Deal 7 damage. Gain 5 block.",
-                         requires_target=True)
+    __slots__ = ()
+
+    _name = "Bash"
+    _description = "Deal 7 damage. Gain 5 block."
+    _damage = 7
+    _block = 5
+    _energy_cost = 2
+    _status_modifiers = EMPTY_STATUS_MODIFIERS
+    _requires_target = True
 
 
 class Neutralize(Card):
@@ -339,9 +506,9 @@ class Neutralize(Card):
             set to 0.
         energy_cost (int): The amount of energy this card costs to play,
             set to 0.
-        status_modifiers (Dict[str, int]): A dictionary describing each status
-            modifier applied when this card is played,
-            set to an {'weak': 1, 'vulnerable': 2}.
+        status_modifiers (Mapping[str, int]): A read-only mapping describing
+            each status modifier applied when this card is played,
+            set to {'weak': 1, 'vulnerable': 2}.
         requires_target (bool): True if playing this card requires a target,
             False otherwise, set to True.
 
@@ -351,7 +518,7 @@ class Neutralize(Card):
         neutralize.get_block(), neutralize.get_energy_cost())
         3 0 0 
         >>> neutralize.get_status_modifiers()
-        {'weak': 1, 'vulnerable': 2} 
+        mappingproxy({'weak': 1, 'vulnerable': 2})
         >>> neutralize.get_name()
         'Neutralize' 
         >>> neutralize.get_description() 
@@ -362,13 +529,15 @@ class Neutralize(Card):
         Neutralize()
     """
 
-    def __init__(self) -> None:
-        super().__init__(card="Neutralize", damage=3, block=0,
-                         energy_cost=0,
-                         status_modifiers={'weak': 1, 'vulnerable': 2},
-                         description="Deal 3 damage. "
-                         "Apply 1 weak. Apply 2 vulnerable.",
-                         requires_target=True)
+    __slots__ = ()
+
+    _name = "Neutralize"
+    _description = "Deal 3 damage. Apply 1 weak. Apply 2 vulnerable."
+    _damage = 3
+    _block = 0
+    _energy_cost = 0
+    _status_modifiers = MappingProxyType({WEAK: 1, VULNERABLE: 2})
+    _requires_target = True
 
 
 class Survivor(Card):
@@ -387,9 +556,9 @@ class Survivor(Card):
             set to 8.
         energy_cost (int): The amount of energy this card costs to play,
             set to 1.
-        status_modifiers (Dict[str, int]): A dictionary describing each status
-            modifier applied when this card is played,
-            set to an {'strength': 1}.
+        status_modifiers (Mapping[str, int]): A read-only mapping describing
+            each status modifier applied when this card is played,
+            set to {'strength': 1}.
         requires_target (bool): True if playing this card requires a target,
             False otherwise, set to False. 
 
@@ -399,7 +568,7 @@ class Survivor(Card):
         survivor.get_energy_cost())
         0 8 1 
         >>> survivor.get_status_modifiers()
-        {'strength': 1} 
+        mappingproxy({'strength': 1})
         >>> survivor.requires_target() 
         False 
         >>> survivor.get_name()
@@ -412,11 +581,22 @@ class Survivor(Card):
         Survivor()
     """
 
-    def __init__(self) -> None:
-        super().__init__(card="Survivor", damage=0, block=8,
-                         energy_cost=1, status_modifiers={'strength': 1},
-                         description="Gain 8 block and 1 strength.",
-                         requires_target=False)
+    __slots__ = ()
+
+    _name = "Survivor"
+    _description = "Gain 8 block and 1 strength."
+    _damage = 0
+    _block = 8
+    _energy_cost = 1
+    _status_modifiers = MappingProxyType({STRENGTH: 1})
+    _requires_target = False
+
+
+# The description of each card that can be asked about by name in main.
+CARD_DESCRIPTIONS = {
+    card_type.__name__: card_type().get_description()
+    for card_type in (Strike, Defend, Bash, Survivor, Neutralize)
+}
 
 
 class Entity:
@@ -448,6 +628,24 @@ class Entity:
             damage caused to it will be increased by 50%.
     """
 
+    __slots__ = (
+        '_max_hp',
+        '_hp',
+        '_block',
+        '_strength',
+        '_weak',
+        '_vulnerable',
+        '_defeated',
+    )
+
+    # The name of the entity's class, kept up to date by __init_subclass__.
+    _name_cached = 'Entity'
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Stores the name of each Entity subclass as a class constant."""
+        super().__init_subclass__(**kwargs)
+        cls._name_cached = cls.__name__
+
     def __init__(self,
                  max_hp: int,
                  ) -> None:
@@ -470,6 +668,8 @@ class Entity:
         self._strength = strength
         self._weak = weak
         self._vulnerable = vulnerable
+        # HP only changes in reduce_hp, which keeps this flag up to date
+        self._defeated = max_hp == 0
 
     def get_hp(self) -> int:
         """Returns the current HP for this entity. 
@@ -563,7 +763,7 @@ class Entity:
             >>> entity.get_name()
             'Entity'
         """
-        return self.__class__.__name__
+        return self._name_cached
 
     def reduce_hp(self, amount: int) -> None:
         """Reduces the HP of a given entity.
@@ -583,15 +783,17 @@ class Entity:
             >>> entity.get_hp()
             18
         """
-        self._block -= amount
-        if self._block > 0:
-            return None
+        block = self._block
+        remaining = amount - block
+        if remaining <= 0:
+            self._block = block - amount
         else:
-            self._hp += self._block
-        if self._hp < 0:
-            self._hp = 0
-        if self._block < 0:
             self._block = 0
+            hp = self._hp - remaining
+            if hp < 0:
+                hp = 0
+            self._hp = hp
+            self._defeated = hp == 0
 
     def is_defeated(self) -> bool:
         """ Returns a boolean value to determine if the entity is defeated.
@@ -607,7 +809,7 @@ class Entity:
             >>> entity.is_defeated()
             False
         """
-        return self._hp == 0
+        return self._defeated
 
     def add_block(self, amount: int) -> None:
         """Adds the given amount to the total block this entity has. 
@@ -677,11 +879,12 @@ class Entity:
             >>> entity.new_turn()
         """
         self._block = 0
-        if self._weak >= 1:
-            self._weak -= 1
-        if self._vulnerable >= 1:
-            self._vulnerable -= 1
-        return None
+        weak = self._weak
+        if weak >= 1:
+            self._weak = weak - 1
+        vulnerable = self._vulnerable
+        if vulnerable >= 1:
+            self._vulnerable = vulnerable - 1
 
     def __str__(self) -> str:
         """Returns a string which represents the current entity.
@@ -716,7 +919,7 @@ class Entity:
             'Entity(20)'
 
         """
-        return f"{self.__class__.__name__}({self.get_max_hp()})"
+        return f"{self._name_cached}({self.get_max_hp()})"
 
 
 class Player(Entity):
@@ -740,14 +943,16 @@ class Player(Entity):
 
     """
 
+    __slots__ = ('_energy', '_hand', '_discard', '_cards', '_deck')
+
     def __init__(self, max_hp: int, cards: list[Card] | None = None) -> None:
         """Initializes the Player subclass and its parent class. 
 
         In addition to executing the initializer for the Entity superclass, this
         method initializes the player's energy which starts at 3, as well as
         three lists of cards (deck, hand, and discard pile). If the cards
-        parameter is not None, the deck is initialized to be cards. Otherwise,
-        it is initialized as an empty list. The players hand and discard
+        parameter is not None, the deck is initialized to be a copy of cards.
+        Otherwise, it is initialized as an empty list. The players hand and discard
         piles start as empty lists.
 
         Args:  
@@ -758,15 +963,13 @@ class Player(Entity):
                 initialized as an empty list.
         """
         super().__init__(max_hp)
-        self._max_hp = max_hp
         self._energy = 3
         self._hand = []
         self._discard = []
         self._cards = cards
-        if cards != None:
-            self._deck = cards
-        else:
-            self._deck = []
+        # Copy the cards so that drawing from the deck never changes the
+        # list that was passed in
+        self._deck = list(cards) if cards is not None else []
 
     def get_energy(self) -> int:
         """Returns the amount of energy the player has remaining.
@@ -849,11 +1052,11 @@ class Player(Entity):
             >>> player.get_deck()
             [Defend(), Defend(), Strike(), Defend(), Strike(), Strike(), Bash()]
         """
-        if not self._hand == []:
-            return None
-        self._deck.extend(self._discard)
-        self._discard = []
-        return None
+        if self._hand:
+            return
+        discard = self._discard
+        self._deck.extend(discard)
+        discard.clear()
 
     def end_turn(self) -> None:
         """Ends players turn, discards hand.
@@ -873,9 +1076,9 @@ class Player(Entity):
             >>> player.get_discarded()
             [Strike(), Defend(), Strike(), Strike(), Bash()]
         """
-        self._discard.extend(self._hand)
-        self._hand = []
-        return None
+        hand = self._hand
+        self._discard.extend(hand)
+        hand.clear()
 
     def new_turn(self) -> None:
         """Starts new player turn, deals a new hand and resets energy levels.
@@ -899,7 +1102,6 @@ class Player(Entity):
         super().new_turn()
         self._energy = 3
         draw_cards(self._deck, self._hand, self._discard)
-        return None
 
     def play_card(self, card_name: str) -> Card | None:
         """Attempts to play a card from the player's hand.
@@ -928,15 +1130,17 @@ class Player(Entity):
                 [Strike(), Defend(), Strike(), Strike()]
         """
 
-        for card in self._hand:
-            if Card.get_name(card) == card_name:
-                if Card.get_energy_cost(card) <= self.get_energy():
-                    self._energy -= Card.get_energy_cost(card)
-                    self._hand.remove(card)
-                    self._discard.append(card)
-                    return card
-                else:
+        hand = self._hand
+        for index, card in enumerate(hand):
+            if card.get_name() == card_name:
+                energy_cost = card.get_energy_cost()
+                if energy_cost > self._energy:
                     return None
+                self._energy -= energy_cost
+                # Remove by position, as hand.remove would scan the hand again
+                del hand[index]
+                self._discard.append(card)
+                return card
         return None
 
     def __repr__(self) -> str:
@@ -956,7 +1160,17 @@ class Player(Entity):
             'Player(20, None)'
 
         """
-        return f"{self.__class__.__name__}({self.get_max_hp()}, {self._cards})"
+        return f"{self._name_cached}({self.get_max_hp()}, {self._cards})"
+
+
+# The starting decks of the predefined players. Cards can not change once
+# created, so every player shares these instances and copies the tuple.
+IRONCLAD_DECK = (Strike(), Strike(), Strike(), Strike(), Strike(),
+                 Defend(), Defend(), Defend(), Defend(),
+                 Bash())
+SILENT_DECK = (Strike(), Strike(), Strike(), Strike(), Strike(),
+               Defend(), Defend(), Defend(), Defend(), Defend(),
+               Neutralize(), Survivor())
 
 
 class IronClad(Player):
@@ -968,17 +1182,14 @@ class IronClad(Player):
     The __init__ method for IronClad does not take any arguments beyond self. 
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """
         Initialize an IronClad instance with the pre-set attribute values.
         """
         super().__init__(80)
-        if self._deck == []:
-            self._deck = [Strike(), Strike(), Strike(), Strike(), Strike(),
-                          Defend(), Defend(), Defend(), Defend(),
-                          Bash()]
-        else:
-            self._deck = self._cards
+        self._deck = list(IRONCLAD_DECK)
 
     def __repr__(self) -> str:
         """Returns the command required to recreate the instance.
@@ -997,7 +1208,7 @@ class IronClad(Player):
             'IronClad()'
 
         """
-        return f"{self.__class__.__name__}()"
+        return f"{self._name_cached}()"
 
 
 class Silent(Player):
@@ -1010,17 +1221,14 @@ class Silent(Player):
     The __init__ method for Silent does not take any arguments beyond self.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """
         Initialize a Silent instance with the pre-set attribute values.
         """
         super().__init__(70)
-        if self._deck == []:
-            self._deck = [Strike(), Strike(), Strike(), Strike(), Strike(),
-                          Defend(), Defend(), Defend(), Defend(), Defend(),
-                          Neutralize(), Survivor()]
-        else:
-            self._deck = self._cards
+        self._deck = list(SILENT_DECK)
 
     def __repr__(self) -> str:
         """Returns the command required to recreate the instance.
@@ -1039,7 +1247,14 @@ class Silent(Player):
             'Silent()'
 
         """
-        return f"{self.__class__.__name__}()"
+        return f"{self._name_cached}()"
+
+
+# The player class for each player type that can be entered by name.
+PLAYER_TYPES = {
+    'ironclad': IronClad,
+    'silent': Silent,
+}
 
 
 class Monster(Entity):
@@ -1062,8 +1277,10 @@ class Monster(Entity):
 
     """
 
-    # Initialises the id variable of monster to allow iteration.
-    _instance_id = 0
+    __slots__ = ('_id',)
+
+    # Counts up from 0, giving each monster created the next id.
+    _instance_ids = count()
 
     def __init__(self, max_hp: int) -> None:
         """Initializes the Monster subclass and its parent class. 
@@ -1079,8 +1296,7 @@ class Monster(Entity):
         """
 
         super().__init__(max_hp)
-        self._id = Monster._instance_id
-        Monster._instance_id += 1
+        self._id = next(Monster._instance_ids)
 
     def get_id(self) -> int:
         """Returns the unique id number of this monster.
@@ -1118,7 +1334,7 @@ class Monster(Entity):
             'Monster(20)'
 
         """
-        return f"{self.__class__.__name__}({self.get_max_hp()})"
+        return f"{self._name_cached}({self.get_max_hp()})"
 
 
 class Louse(Monster):
@@ -1129,6 +1345,8 @@ class Louse(Monster):
     and is not dynamic after initialisation.
     """
 
+    __slots__ = ('amount',)
+
     def __init__(self, max_hp: int) -> None:
         """Initialises the Louse subclass and its parent classes. 
 
@@ -1184,8 +1402,8 @@ class Cultist(Monster):
     chance that a weak status modifier will be applied to the player on attack.
 
     """
-    # Initialises the number of calls variable of Cultist to allow iteration.
-    _num_calls = 0
+
+    __slots__ = ('_num_calls',)
 
     def __init__(self, max_hp: int) -> None:
         """Initialises the Cultist subclass and its parent classes. 
@@ -1195,6 +1413,9 @@ class Cultist(Monster):
                 this Cultist instance.
         """
         super().__init__(max_hp)
+        # Initialises the number of calls variable of Cultist to allow
+        # iteration.
+        self._num_calls = 0
 
     def action(self) -> dict[str, int]:
         """Returns a dictionary containing damage and weak amount, damage will
@@ -1226,22 +1447,13 @@ class Cultist(Monster):
             >>> cultist.action()
             {'damage': 9, 'weak': 1}
         """
-        if self._num_calls == 0:
-            self.damage_amount = 0
-        if self._num_calls == 1:
-            self.damage_amount = 6 + 1
-        if self._num_calls > 1:
-            self.damage_amount += 1
-        if self._num_calls == 0:
-            self.weak_amount = 1
-        if self.damage_amount % 2 != 0:
-            self.weak_amount = 1
-        elif self.damage_amount % 2 == 0:
-            self.weak_amount = 0
-        self._num_calls += 1
-        damage_amount = self.damage_amount
-        weak_amount = self.weak_amount
-        return {'damage': damage_amount, 'weak': weak_amount}
+        num_calls = self._num_calls
+        self._num_calls = num_calls + 1
+        if num_calls == 0:
+            return {'damage': 0, 'weak': 0}
+        # Damage is 6 + num_calls, and weak is 1 exactly when damage is odd
+        damage_amount = 6 + num_calls
+        return {'damage': damage_amount, 'weak': damage_amount & 1}
 
 
 class JawWorm(Monster):
@@ -1252,6 +1464,8 @@ class JawWorm(Monster):
     as damage. And half is rounded down and applied as block to itself.
     """
 
+    __slots__ = ()
+
     def __init__(self, max_hp: int) -> None:
         """Initialises the JawWorm subclass and its parent classes.
 
@@ -1293,11 +1507,43 @@ class JawWorm(Monster):
             >>> jaw_worm.get_block()
             6
         """
-        self.damage_amount = -(super().get_hp() - super().get_max_hp()) / 2
-        block_to_add = self.damage_amount.__ceil__()
-        super().add_block(block_to_add)
-        damage_to_deal = self.damage_amount.__floor__()
-        return {'damage': damage_to_deal}
+        hp_lost = self.get_max_hp() - self.get_hp()
+        # Half of the HP lost, rounded up and rounded down respectively
+        self.add_block((hp_lost + 1) // 2)
+        return {'damage': hp_lost // 2}
+
+
+# The monster class for each monster name that can appear in a game file.
+MONSTER_TYPES = {
+    monster_type.__name__: monster_type
+    for monster_type in (Louse, Cultist, JawWorm)
+}
+
+
+def modify_damage(amount: int, vulnerable: int, weak: int) -> float:
+    """Returns an amount of damage after applying vulnerable and weak.
+
+    Damage is increased by 50% if the target is vulnerable, and then
+    reduced by 25% if the attacker is weak. If neither applies, the amount
+    is returned unchanged.
+
+    Args:
+        amount (int): The damage before any status effects.
+        vulnerable (int): The number of turns the target is vulnerable for.
+        weak (int): The number of turns the attacker is weak for.
+
+    Returns:
+        float: The damage after applying the status effects.
+
+    Example:
+        >>> modify_damage(8, 1, 1)
+        9.0
+    """
+    if vulnerable > 0:
+        amount *= 1.5
+    if weak > 0:
+        amount *= 0.75
+    return amount
 
 
 class Encounter:
@@ -1307,7 +1553,9 @@ class Encounter:
     facilitates the interactions between the player and monsters.
     """
 
-    def __init__(self, player: Player, monsters: list[tuple[str, int]]) -> None:
+    def __init__(
+        self, player: Player | str, monsters: list[tuple[str, int]]
+    ) -> None:
         """
         The initializer for an encounter takes the player instance,
         as well as a list of tuples describing the monsters in the encounter. 
@@ -1319,7 +1567,8 @@ class Encounter:
         (see start_new_turn below for a description)
 
         Args:
-            player (Player): Identifies the player subclass to be used.
+            player (Player | str): The player, or the name of a player type
+                in PLAYER_TYPES to create a new player of.
             monsters (list[tuple[str, int]]): List of tuples which identify 
                 the monsters. The tuples should be in the format of 
                 ('monster_name', monster_max_hp).
@@ -1328,19 +1577,22 @@ class Encounter:
         # Initialises a variable which will be used to determine whether its the
         # player or the monster turn.       'p' = player, 'm' = monster
         self._whos_turn = ''
-        if player == 'ironclad':
-            self.player = IronClad()
-        if player == 'silent':
-            self.player = Silent()
-        else:
-            self.player = player
-        self.start_monsters = []
-        for items in monsters:
-            monster_name, monster_max_hp = items
-            self.start_monsters.append(globals()[monster_name](monster_max_hp))
+        if isinstance(player, str):
+            player = PLAYER_TYPES[player]()
+        self.player = player
+        self.start_monsters = [
+            MONSTER_TYPES[monster_name](monster_max_hp)
+            for monster_name, monster_max_hp in monsters
+        ]
+        # Monsters that are not yet defeated, in order and by their id. These
+        # are pruned by get_monsters once a monster is defeated, rather than
+        # rebuilt on every call.
+        self.monsters_remaining = [monster for monster in self.start_monsters
+                                   if not monster.is_defeated()]
+        self._monsters_by_id = {
+            monster.get_id(): monster for monster in self.monsters_remaining}
         player.start_new_encounter()
         self.start_new_turn()
-        return None
 
     def start_new_turn(self) -> None:
         """Starts new turn, sets to player's turn.
@@ -1357,7 +1609,6 @@ class Encounter:
         """
         self._whos_turn = 'p'
         self.player.new_turn()
-        return None
 
     def end_player_turn(self) -> None:
         """Ends the player's turn and starts the monster's turn.
@@ -1379,7 +1630,6 @@ class Encounter:
         self.player.end_turn()
         for monster in self.get_monsters():
             monster.new_turn()
-        return None
 
     def get_player(self) -> Player:
         """Returns the player in this encounter.
@@ -1411,11 +1661,17 @@ class Encounter:
             [Louse(10)]
 
         """
-        self.monsters_remaining = []
-        for monster in self.start_monsters:
-            if monster.is_defeated() == False:
-                self.monsters_remaining.append(monster)
-        return self.monsters_remaining
+        remaining = self.monsters_remaining
+        # If a monster has been defeated since the last call, however it was
+        # damaged, drop it from both the list and the id lookup.
+        if any(monster.is_defeated() for monster in remaining):
+            monsters_by_id = self._monsters_by_id
+            for monster in remaining:
+                if monster.is_defeated():
+                    del monsters_by_id[monster.get_id()]
+            remaining[:] = [
+                monster for monster in remaining if not monster.is_defeated()]
+        return remaining
 
     def is_active(self) -> bool:
         """Returns True if there are monsters remaining in this encounter, 
@@ -1429,16 +1685,13 @@ class Encounter:
             >>> player = Silent()
             >>> monsters = [('Louse', 10)]
             >>> encounter = Encounter(player, monsters)
-            >>> encounter.is_active() == True
+            >>> encounter.is_active()
             True
             >>> another_encounter = Encounter(Silent(), [])
-            >>> another_encounter.is_active() == False
-            True
+            >>> another_encounter.is_active()
+            False
         """
-        if self.get_monsters() != []:
-            return True
-        else:
-            return False
+        return bool(self.get_monsters())
 
     def player_apply_card(self, card_name: str,
                           target_id: int | None = None) -> bool:
@@ -1469,12 +1722,12 @@ class Encounter:
         if self._whos_turn != 'p':
             return False
 
+        player = self.player
+
         # Check to see if player has the card in their hand.
-        for cards in self.player.get_hand():
-            if cards.get_name() == card_name:
-                card = cards
-                break
-        else:
+        card = next((card for card in player.get_hand()
+                     if card.get_name() == card_name), None)
+        if card is None:
             return False
 
         # Assign requires_target result to prevent calling again
@@ -1483,51 +1736,32 @@ class Encounter:
         # Check if the Card requires a target. If it does,
         # ensure a valid target_id is provided.
         if requires_target:
-            if target_id == None:
+            if target_id is None:
+                return False
+            target = self._monsters_by_id.get(target_id)
+            if target is None or target.is_defeated():
                 return False
-            else:
-                for monster in self.get_monsters():
-                    if monster.get_id() == target_id:
-                        break
-                else:
-                    return False
 
         # Attempt to play the card.
-        if self.player.play_card(card.get_name()) != card:
+        if player.play_card(card_name) != card:
             return False
 
+        # Get the status effects of the card once, as a tuple.
+        status_values = card.get_status_values()
+
         # Add any block and strength from the card to the player.
-        self.player.add_block(card.get_block())
-        self.player.add_strength(card.get_strength())
-
-        # Get any vulnerable or weakness effects the card may have.
-        weak_effect = card.get_status_modifiers().get("weak")
-        vuln_effect = card.get_status_modifiers().get("vulnerable")
-        if weak_effect == None:
-            weak_effect = 0
-        if vuln_effect == None:
-            vuln_effect = 0
-
-        # Apply any vulnerable or weakness effects to the target.
-        if requires_target:
-            for mon in self.get_monsters():
-                if mon.get_id() == target_id:
-                    mon.add_vulnerable(vuln_effect)
-                    mon.add_weak(weak_effect)
-                    target = mon
-                    break
-            else:
-                return False
+        player.add_block(card.get_block())
+        player.add_strength(status_values[STRENGTH_INDEX])
 
-        # Calculate and apply damage amount.
         if requires_target:
-            damage_multi = 1
-            if target.get_vulnerable() > 0:
-                damage_multi *= 1.5
-            if self.player.get_weak() > 0:
-                damage_multi *= 0.75
-            damage_amount = (int((card.get_damage_amount()
-                                  + self.player.get_strength()) * damage_multi))
+            # Apply any vulnerable or weakness effects to the target.
+            target.add_vulnerable(status_values[VULNERABLE_INDEX])
+            target.add_weak(status_values[WEAK_INDEX])
+
+            # Calculate and apply damage amount.
+            damage_amount = modify_damage(
+                card.get_damage_amount() + player.get_strength(),
+                target.get_vulnerable(), player.get_weak())
             target.reduce_hp(int(damage_amount))
 
             # Update list of remaining monsters.
@@ -1541,7 +1775,8 @@ class Encounter:
 
         This method attempts to allow all remaining monsters 
         in the encounter to take an action. This method
-        immediately returns if it is the player's turn. 
+        immediately returns if it is the player's turn, and stops as soon as
+        the player is defeated. Otherwise, the player's next turn is started.
 
         Example:
         >>> player = Silent()
@@ -1555,31 +1790,38 @@ class Encounter:
         64 
         """
         if self._whos_turn == 'p':
-            return None
-        for mon in self.get_monsters():
+            return
+        player = self.player
+        # Iterate over a snapshot, so the remaining monsters list can change
+        # during the turn without disturbing the loop.
+        for mon in tuple(self.get_monsters()):
+            if mon.is_defeated():
+                continue
             action = mon.action()
             per_mon_damage = action.get("damage", 0)
-            if "weak" in action:
-                self.player.add_weak(action.get("weak", 0))
-            if "vulnerable" in action:
-                self.player.add_vulnerable(action.get("vulnerable", 0))
-            if "strength" in action:
-                mon.add_strength(action.get("strength", 0))
-            if mon.get_strength() > 0:
-                per_mon_damage += mon.get_strength()
-            if self.player.get_vulnerable() > 0:
-                per_mon_damage *= 1.5
-            if mon.get_weak() > 0:
-                per_mon_damage *= 0.75
-            self.player.reduce_hp(per_mon_damage)
+            if WEAK in action:
+                player.add_weak(action[WEAK])
+            if VULNERABLE in action:
+                player.add_vulnerable(action[VULNERABLE])
+            if STRENGTH in action:
+                mon.add_strength(action[STRENGTH])
+            strength = mon.get_strength()
+            if strength > 0:
+                per_mon_damage += strength
+            per_mon_damage = modify_damage(
+                per_mon_damage, player.get_vulnerable(), mon.get_weak())
+            player.reduce_hp(per_mon_damage)
+            # The remaining monsters have nothing left to do once the player
+            # is defeated, and a defeated player does not draw a new hand.
+            if player.is_defeated():
+                return
         self.start_new_turn()
-        return None
 
 
 def main():
     """Runs the main logic of the program."""
 
-    def mv_get_description(user_input: str) -> None:
+    def mv_get_description(tokens: list[str]) -> None:
         """
         When the user enters this command, the description for the card
         with the given card_name should be printed. The description of the card
@@ -1587,15 +1829,13 @@ def main():
         not have an instance of the requested card. 
 
         Args:
-            user_input (str): The input that will be interpreted.
+            tokens (list[str]): The words of the input to be interpreted.
         """
-        card = user_input.split()[1]
-        if card in cards:
-            selected_card = cards.get(card)
-            print(f"\n{selected_card.get_description()}", end="\n\n")
-        return None
+        description = CARD_DESCRIPTIONS.get(tokens[1])
+        if description is not None:
+            print(f"\n{description}", end="\n\n")
 
-    def mv_end_turn(user_input: str) -> None:
+    def mv_end_turn(tokens: list[str]) -> None:
         """
         When the user enters this command, the player's turn will end,
         and the enemy turn will run. If the player is defeated after the
@@ -1603,17 +1843,16 @@ def main():
         Otherwise the resulting encounter state is displayed.
 
         Args: 
-            user_input (str): This is not used here and is only implemented so 
+            tokens (list[str]): This is not used here and is only implemented so 
             the same command can be used for all move types.
         """
         encounter.end_player_turn()
         encounter.enemy_turn()
         if player.get_hp() == 0:
-            return None
+            return
         display_encounter(encounter)
-        return None
 
-    def mv_inspect(user_input: str) -> None:
+    def mv_inspect(tokens: list[str]) -> None:
         """Plays the inspect move.
 
         When the user enters 'inspect deck', the player's deck should be
@@ -1621,15 +1860,14 @@ def main():
         pile should be printed.
 
         Args:
-            user_input (string): The input that will be interpreted.
+            tokens (list[str]): The words of the input to be interpreted.
         """
-        if user_input.split()[1] == "deck":
+        if tokens[1] == "deck":
             print(f"\n{encounter.player.get_deck()}", end="\n\n")
-        if user_input.split()[1] == "discard":
+        if tokens[1] == "discard":
             print(f"\n{encounter.player.get_discarded()}", end="\n\n")
-        return None
 
-    def mv_play(user_input: str) -> None:
+    def mv_play(tokens: list[str]) -> None:
         """Tries to convert the user input into a play card command.
 
         Attempts to play a card. If the card application fails for any
@@ -1640,34 +1878,23 @@ def main():
         encounter.
 
         Args:
-            user_input (string): The input that will be interpreted.
+            tokens (list[str]): The words of the input to be interpreted.
         """
-        input = user_input.split()
-        if len(input) == 2:
-            card_name = input[1]
+        if len(tokens) == 2:
+            card_name = tokens[1]
             if (not encounter.player_apply_card(card_name)
                     and encounter.is_active()):
                 print(CARD_FAILURE_MESSAGE)
             else:
                 display_encounter(encounter)
-        if len(input) == 3:
-            card_name = input[1]
-            target_id = int(input[2])
+        if len(tokens) == 3:
+            card_name = tokens[1]
+            target_id = int(tokens[2])
             if encounter.player_apply_card(card_name, target_id):
                 display_encounter(encounter)
             else:
                 if encounter.is_active():
                     print(CARD_FAILURE_MESSAGE)
-        return None
-
-    # List of all the cards avaliable in the game. For mv_get_description.
-    cards = {
-        "Strike": Strike(),
-        "Defend": Defend(),
-        "Bash": Bash(),
-        "Survivor": Survivor(),
-        "Neutralize": Neutralize()
-    }
 
     # Dictionary of the possibles user input moves.
     moves = {
@@ -1683,10 +1910,7 @@ def main():
     encounters = read_game_file(game_file)
 
     # Init the persistent player class.
-    if player == "silent":
-        player = Silent()
-    if player == "ironclad":
-        player = IronClad()
+    player = PLAYER_TYPES[player]()
 
     # Play through all encounters manually.
     for enc_mons in encounters:
@@ -1698,9 +1922,11 @@ def main():
 
         # Continually prompt for and play user moves.
         while encounter.is_active() and player.get_hp() > 0:
-            user_input = input("Enter a move: ")
-            if user_input.split()[0] in moves:
-                moves.get(user_input.split()[0])(user_input)
+            # Split the move once, and pass the words on to its handler.
+            tokens = input("Enter a move: ").split()
+            move = moves.get(tokens[0]) if tokens else None
+            if move is not None:
+                move(tokens)
             if not encounter.is_active():
                 player.end_turn()
                 print(f"{ENCOUNTER_WIN_MESSAGE}", end="\n")